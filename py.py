@@ -5,6 +5,8 @@ import json
 import math
 import random
 import sys
+from collections import deque
+from enum import IntEnum
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -12,12 +14,18 @@ import pygame
 
 WIDTH, HEIGHT = 900, 600
 FPS = 60
+FIXED_DT = 1.0 / 120.0  # fixed simulation step; rendering interpolates between steps
+MAX_FRAME_TIME = 0.05   # clamp for stalls so physics never takes a giant step
 PLAYER_SPEED = 280  # pixels per second
 INVULN_TIME = 1.0   # seconds after a hit
 TRAIL_LENGTH = 12
 SPRITE_TILE = 16
 PLAYER_SPRITE_SCALE = 3
 ITEM_SPRITE_SCALE = 3
+ITEM_ROT_STEPS = 32  # discrete rotation steps between -10 and +10 degrees
+PARTICLE_ALPHA_STEPS = 16  # discrete fade levels shared by all particles
+MAX_PARTICLES = 256  # hard cap on live particles; bursts past it are trimmed
+SPAWN_CELL = 64  # spatial-hash cell size for spawn spacing checks
 HIGHSCORE_FILENAME = "mouse_dash_highscore.json"
 COMBO_WINDOW = 1.25
 COMBO_BONUS_STEP = 2
@@ -50,6 +58,20 @@ DIFFICULTIES = [
     },
 ]
 
+# Top strip holding score/timer/lives/combo text; redrawn every frame.
+HUD_RECT = pygame.Rect(0, 0, WIDTH, 112)
+
+# Shared steady-camera offset; immutable, so every quiet frame reuses it.
+_ZERO_OFFSET = (0.0, 0.0)
+
+
+class State(IntEnum):
+    MENU = 0
+    PLAYING = 1
+    PAUSED = 2
+    GAME_OVER = 3
+
+
 COLORS = {
     "bg_top": (20, 160, 200),
     "bg_bottom": (10, 90, 140),
@@ -64,6 +86,12 @@ COLORS = {
     "gold": (255, 226, 120),
 }
 
+# Effect colors resolved to module constants at import; the mid-round
+# spawn paths bind these instead of re-entering the dict per call.
+_COLOR_GOLD = COLORS["gold"]
+_COLOR_ITEM = COLORS["item"]
+_COLOR_HAZARD = COLORS["hazard"]
+
 
 def _try_load_image(path: Path) -> Optional[pygame.Surface]:
     try:
@@ -83,23 +111,33 @@ def _slice_sheet(sheet: pygame.Surface, tile_size: int) -> List[pygame.Surface]:
             if rect.right > width or rect.bottom > height:
                 continue
             frame = sheet.subsurface(rect).copy()
-            if pygame.mask.from_surface(frame).count() == 0:
+            # Cheaper empty-tile test than building a mask and counting its
+            # bits: the bounding rect of visible pixels collapses to 0x0.
+            if frame.get_bounding_rect(min_alpha=1).width == 0:
                 continue
             frames.append(frame)
     return frames
 
 
 def _scale_surface(surface: pygame.Surface, scale: int) -> pygame.Surface:
+    # Derived surfaces are re-converted to the display format so every blit
+    # takes SDL's fast path instead of converting pixels per blit.
     return pygame.transform.scale(
         surface,
         (surface.get_width() * scale, surface.get_height() * scale),
-    )
+    ).convert_alpha()
+
+
+def _alpha_variant(surface: pygame.Surface, alpha: int) -> pygame.Surface:
+    variant = surface.copy()
+    variant.set_alpha(alpha)
+    return variant
 
 
 def _make_shadow(surface: pygame.Surface, alpha: int = 140) -> pygame.Surface:
     shadow = surface.copy()
     shadow.fill((0, 0, 0, alpha), special_flags=pygame.BLEND_RGBA_MULT)
-    return shadow
+    return shadow.convert_alpha()
 
 
 class Assets:
@@ -107,6 +145,8 @@ class Assets:
         self.base_dir = base_dir
         self.cheese: Optional[pygame.Surface] = None
         self.cheese_shadow: Optional[pygame.Surface] = None
+        self.cheese_rots: List[pygame.Surface] = []
+        self.cheese_shadow_rots: List[pygame.Surface] = []
         self.mouse_frames: List[pygame.Surface] = []
         self.mouse_shadows: List[pygame.Surface] = []
         self._load()
@@ -119,6 +159,8 @@ class Assets:
             if cheese is not None:
                 self.cheese = _scale_surface(cheese, ITEM_SPRITE_SCALE)
                 self.cheese_shadow = _make_shadow(self.cheese)
+                self.cheese_rots = self._build_rotations(self.cheese)
+                self.cheese_shadow_rots = self._build_rotations(self.cheese_shadow)
                 break
 
         for sprite_dir in sprite_dirs:
@@ -128,6 +170,15 @@ class Assets:
                 self.mouse_shadows = [_make_shadow(frame) for frame in frames]
                 break
 
+    @staticmethod
+    def _build_rotations(surface: pygame.Surface) -> List[pygame.Surface]:
+        # Rotating every frame allocates a new surface each call; the wobble only
+        # spans -10..+10 degrees, so a small table of pre-rotated copies is enough.
+        return [
+            pygame.transform.rotate(surface, -10 + 20 * i / (ITEM_ROT_STEPS - 1)).convert_alpha()
+            for i in range(ITEM_ROT_STEPS)
+        ]
+
     def _load_mouse_frames(self, sprite_dir: Path) -> List[pygame.Surface]:
         if not sprite_dir.exists():
             return []
@@ -146,48 +197,108 @@ class Assets:
 
 
 class Player:
+    # Position/velocity live as plain floats: Vector2 ops allocate a fresh
+    # object per call, and __slots__ keeps attribute access cheap in the
+    # per-frame update/draw loops.
+    __slots__ = (
+        "px",
+        "py",
+        "prev_px",
+        "prev_py",
+        "frames",
+        "shadows",
+        "frames_flipped",
+        "shadows_flipped",
+        "frames_dim",
+        "frames_bright",
+        "frames_dim_flipped",
+        "frames_bright_flipped",
+        "radius",
+        "_trail_surfs",
+        "hit_cooldown",
+        "trail",
+        "trail_tick",
+        "anim_time",
+        "anim_index",
+        "last_move_x",
+    )
+
     def __init__(
         self,
         pos: Tuple[int, int],
         frames: Optional[List[pygame.Surface]] = None,
         shadows: Optional[List[pygame.Surface]] = None,
     ):
-        self.pos = pygame.Vector2(pos)
+        self.px = float(pos[0])
+        self.py = float(pos[1])
+        self.prev_px = self.px
+        self.prev_py = self.py
         self.frames = frames or []
         self.shadows = shadows or []
-        self.frames_flipped = [pygame.transform.flip(frame, True, False) for frame in self.frames]
-        self.shadows_flipped = [pygame.transform.flip(shadow, True, False) for shadow in self.shadows]
+        self.frames_flipped = [pygame.transform.flip(frame, True, False).convert_alpha() for frame in self.frames]
+        self.shadows_flipped = [pygame.transform.flip(shadow, True, False).convert_alpha() for shadow in self.shadows]
+        # Invulnerability blink: both alpha levels pre-applied once, so the
+        # draw path never copies a frame just to call set_alpha on it.
+        self.frames_dim = [_alpha_variant(f, 110) for f in self.frames]
+        self.frames_bright = [_alpha_variant(f, 220) for f in self.frames]
+        self.frames_dim_flipped = [_alpha_variant(f, 110) for f in self.frames_flipped]
+        self.frames_bright_flipped = [_alpha_variant(f, 220) for f in self.frames_flipped]
         self.radius = (self.frames[0].get_width() // 2) if self.frames else 18
+        self._trail_surfs: List[Optional[pygame.Surface]] = []
+        if not self.frames:
+            # Pre-render one trail circle per alpha step; the fallback draw
+            # otherwise allocates and rasterizes TRAIL_LENGTH surfaces a frame.
+            body_color = COLORS["player"]
+            for idx in range(TRAIL_LENGTH):
+                alpha = int(120 * (idx / TRAIL_LENGTH))
+                if alpha <= 0:
+                    self._trail_surfs.append(None)
+                    continue
+                surf = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(
+                    surf,
+                    (body_color[0], body_color[1], body_color[2], alpha),
+                    (self.radius, self.radius),
+                    self.radius - 4,
+                )
+                self._trail_surfs.append(surf.convert_alpha())
         self.hit_cooldown = 0.0
-        self.trail: List[pygame.Vector2] = []
+        self.trail: deque = deque(maxlen=TRAIL_LENGTH)
+        self.trail_tick = 0
         self.anim_time = 0.0
         self.anim_index = 0
-        self.last_move = pygame.Vector2(1, 0)
+        self.last_move_x = 1.0
 
     def update(self, keys, dt: float):
-        direction = pygame.Vector2(0, 0)
+        self.prev_px = self.px
+        self.prev_py = self.py
+        dx = 0.0
+        dy = 0.0
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            direction.x -= 1
+            dx -= 1.0
         if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            direction.x += 1
+            dx += 1.0
         if keys[pygame.K_UP] or keys[pygame.K_w]:
-            direction.y -= 1
+            dy -= 1.0
         if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            direction.y += 1
-        if direction.length_squared() > 0:
-            direction = direction.normalize()
-            self.last_move = direction
-        self.pos += direction * PLAYER_SPEED * dt
-        self.pos.x = max(self.radius, min(WIDTH - self.radius, self.pos.x))
-        self.pos.y = max(self.radius + 40, min(HEIGHT - self.radius, self.pos.y))
+            dy += 1.0
+        moving = dx != 0.0 or dy != 0.0
+        if moving:
+            inv = 1.0 / math.hypot(dx, dy)
+            dx *= inv
+            dy *= inv
+            self.last_move_x = dx
+        self.px = max(self.radius, min(WIDTH - self.radius, self.px + dx * PLAYER_SPEED * dt))
+        self.py = max(self.radius + 40, min(HEIGHT - self.radius, self.py + dy * PLAYER_SPEED * dt))
         if self.hit_cooldown > 0:
             self.hit_cooldown = max(0.0, self.hit_cooldown - dt)
-        self.trail.append(self.pos.copy())
-        if len(self.trail) > TRAIL_LENGTH:
-            self.trail.pop(0)
+        # Sample the trail every other fixed step so the 12-slot deque
+        # spans the same stretch of motion it did at one-per-frame 60 Hz.
+        self.trail_tick ^= 1
+        if self.trail_tick:
+            self.trail.append((self.px, self.py))
 
         if self.frames:
-            moving = direction.length_squared() > 0
             if moving:
                 self.anim_time += dt
                 if self.anim_time >= 0.08:
@@ -203,89 +314,117 @@ class Player:
     def mark_hit(self):
         self.hit_cooldown = INVULN_TIME
 
-    def draw(self, surface, offset: pygame.Vector2):
+    def draw(self, surface, offset: Tuple[float, float], alpha: float = 1.0):
+        if alpha < 1.0:
+            rx = self.prev_px + (self.px - self.prev_px) * alpha
+            ry = self.prev_py + (self.py - self.prev_py) * alpha
+        else:
+            rx, ry = self.px, self.py
+        ox, oy = offset
+        x = rx + ox
+        y = ry + oy
         if self.frames:
-            pos = self.pos + offset
-            facing_left = self.last_move.x < 0
-            frames = self.frames_flipped if facing_left else self.frames
+            facing_left = self.last_move_x < 0
+            if self.hit_cooldown > 0:
+                dim = int(self.hit_cooldown * 12) % 2 == 0
+                if facing_left:
+                    frames = self.frames_dim_flipped if dim else self.frames_bright_flipped
+                else:
+                    frames = self.frames_dim if dim else self.frames_bright
+            else:
+                frames = self.frames_flipped if facing_left else self.frames
             shadows = self.shadows_flipped if facing_left else self.shadows
             frame = frames[self.anim_index % len(frames)]
             shadow = shadows[self.anim_index % len(shadows)] if shadows else None
-
-            if self.hit_cooldown > 0:
-                alpha = 110 if int(self.hit_cooldown * 12) % 2 == 0 else 220
-                frame = frame.copy()
-                frame.set_alpha(alpha)
-            rect = frame.get_rect(center=(int(pos.x), int(pos.y)))
+            rect = frame.get_rect(center=(int(x), int(y)))
             if shadow is not None:
                 shadow_rect = rect.move(3, 4)
                 surface.blit(shadow, shadow_rect)
             surface.blit(frame, rect)
-            return
+            return rect.union(rect.move(3, 4))
 
-        pos = self.pos + offset
         body_color = COLORS["player"]
         outline = COLORS["player_outline"]
+        # Covers body, ears, whiskers, tail and the offset shadow.
+        area = pygame.Rect(0, 0, (self.radius + 16) * 2, (self.radius + 16) * 2)
+        area.center = (int(x), int(y + 6))
         # Shadow
-        pygame.draw.circle(surface, COLORS["shadow"], pos + pygame.Vector2(3, 4), self.radius + 2)
-        # Trail with fading circles
+        pygame.draw.circle(surface, COLORS["shadow"], (x + 3, y + 4), self.radius + 2)
+        # Trail with fading circles, blitted from the pre-rendered table
+        trail_len = len(self.trail)
         for idx, tpos in enumerate(self.trail):
-            alpha = int(120 * (idx / len(self.trail))) if self.trail else 0
-            if alpha <= 0:
+            trail_surface = self._trail_surfs[idx * TRAIL_LENGTH // trail_len]
+            if trail_surface is None:
                 continue
-            shade = (body_color[0], body_color[1], body_color[2], alpha)
-            trail_surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(trail_surface, shade, (self.radius, self.radius), self.radius - 4)
-            trail_rect = trail_surface.get_rect(center=(int(tpos.x + offset.x), int(tpos.y + offset.y)))
+            trail_rect = trail_surface.get_rect(center=(int(tpos[0] + ox), int(tpos[1] + oy)))
             surface.blit(trail_surface, trail_rect)
+            area.union_ip(trail_rect)
         # Body
-        pygame.draw.circle(surface, body_color, pos, self.radius)
+        pygame.draw.circle(surface, body_color, (x, y), self.radius)
         # Ears
-        pygame.draw.circle(surface, body_color, pos + pygame.Vector2(-8, -10), self.radius // 2)
-        pygame.draw.circle(surface, body_color, pos + pygame.Vector2(8, -10), self.radius // 2)
+        pygame.draw.circle(surface, body_color, (x - 8, y - 10), self.radius // 2)
+        pygame.draw.circle(surface, body_color, (x + 8, y - 10), self.radius // 2)
         # Eyes
-        eye_dir = (self.trail[-1] - self.trail[-2]) if len(self.trail) >= 2 else pygame.Vector2(0, 0)
-        eye_dir = eye_dir.normalize() * 2 if eye_dir.length_squared() > 0 else pygame.Vector2(0, 0)
-        pygame.draw.circle(surface, outline, pos + pygame.Vector2(-5, -3) + eye_dir, 3)
-        pygame.draw.circle(surface, outline, pos + pygame.Vector2(5, -3) + eye_dir, 3)
+        eye_x = eye_y = 0.0
+        if len(self.trail) >= 2:
+            ex = self.trail[-1][0] - self.trail[-2][0]
+            ey = self.trail[-1][1] - self.trail[-2][1]
+            length = math.hypot(ex, ey)
+            if length > 0:
+                eye_x = ex / length * 2
+                eye_y = ey / length * 2
+        pygame.draw.circle(surface, outline, (x - 5 + eye_x, y - 3 + eye_y), 3)
+        pygame.draw.circle(surface, outline, (x + 5 + eye_x, y - 3 + eye_y), 3)
         # Nose
-        pygame.draw.circle(surface, (240, 140, 140), pos + pygame.Vector2(0, 8), 3)
+        pygame.draw.circle(surface, (240, 140, 140), (x, y + 8), 3)
         # Whiskers
-        pygame.draw.line(surface, outline, pos + pygame.Vector2(-3, 6), pos + pygame.Vector2(-12, 4), 2)
-        pygame.draw.line(surface, outline, pos + pygame.Vector2(3, 6), pos + pygame.Vector2(12, 4), 2)
+        pygame.draw.line(surface, outline, (x - 3, y + 6), (x - 12, y + 4), 2)
+        pygame.draw.line(surface, outline, (x + 3, y + 6), (x + 12, y + 4), 2)
         # Tail
-        pygame.draw.line(surface, outline, pos + pygame.Vector2(0, 10), pos + pygame.Vector2(0, 24), 3)
+        pygame.draw.line(surface, outline, (x, y + 10), (x, y + 24), 3)
         # Outline
-        pygame.draw.circle(surface, outline, pos, self.radius, 2)
+        pygame.draw.circle(surface, outline, (x, y), self.radius, 2)
+        return area
 
 
 class Item:
     def __init__(
         self,
         pos: pygame.Vector2,
-        sprite: Optional[pygame.Surface] = None,
-        shadow: Optional[pygame.Surface] = None,
+        sprites: Optional[List[pygame.Surface]] = None,
+        shadows: Optional[List[pygame.Surface]] = None,
+        radius: Optional[int] = None,
     ):
         self.pos = pos
-        self.sprite = sprite
-        self.shadow = shadow
-        self.radius = (self.sprite.get_width() // 2) if self.sprite else 10
+        self.sprites = sprites or []
+        self.shadows = shadows or []
+        # Collision radius comes from the unrotated base sprite: the
+        # pre-rotated LUT frames have bigger bounding boxes, so measuring
+        # sprites[0] would silently widen the pickup circle.
+        if radius is not None:
+            self.radius = radius
+        else:
+            self.radius = (self.sprites[0].get_width() // 2) if self.sprites else 10
         self.wobble = random.uniform(0, math.pi * 2)
+        # Cached so the per-frame wobble needs no sin() call of its own:
+        # sin(t + wobble) = sin(t)*cos(wobble) + cos(t)*sin(wobble).
+        self._sin_wobble = math.sin(self.wobble)
+        self._cos_wobble = math.cos(self.wobble)
 
-    def draw(self, surface, time_accum: float, offset: pygame.Vector2):
+    def draw(self, surface, sin_t: float, cos_t: float, offset: Tuple[float, float]):
         # Small bobbing animation
-        bob = math.sin(time_accum * 4 + self.wobble) * 2
-        center = (int(self.pos.x + offset.x), int(self.pos.y + offset.y + bob))
+        wave = sin_t * self._cos_wobble + cos_t * self._sin_wobble
+        bob = wave * 2
+        center = (int(self.pos.x + offset[0]), int(self.pos.y + offset[1] + bob))
 
-        if self.sprite is not None:
-            angle = math.sin(time_accum * 4 + self.wobble) * 10
-            sprite = pygame.transform.rotate(self.sprite, angle)
-            shadow = pygame.transform.rotate(self.shadow, angle) if self.shadow is not None else None
+        if self.sprites:
+            idx = int((wave + 1) * 0.5 * (ITEM_ROT_STEPS - 1))
+            sprite = self.sprites[idx]
             rect = sprite.get_rect(center=center)
-            if shadow is not None:
-                surface.blit(shadow, rect.move(2, 3))
+            if self.shadows:
+                surface.blit(self.shadows[idx], rect.move(2, 3))
             surface.blit(sprite, rect)
-            return
+            return rect.union(rect.move(2, 3))
 
         pygame.draw.circle(surface, COLORS["shadow"], (center[0] + 2, center[1] + 2), self.radius)
         pygame.draw.circle(surface, COLORS["item"], center, self.radius)
@@ -298,43 +437,47 @@ class Item:
         )
         shine_rect = shine.get_rect(center=center)
         surface.blit(shine, shine_rect)
+        area = pygame.Rect(0, 0, self.radius * 2, self.radius * 2)
+        area.center = center
+        return area.union(area.move(2, 2))
 
 
 class Hazard:
+    """Plain-data hazard: position/velocity live as floats and the per-frame
+    integration happens in one batched loop in Game.update_hazards."""
+
     def __init__(self, pos: pygame.Vector2, speed_range: Tuple[int, int]):
-        self.pos = pos
+        self.x = float(pos.x)
+        self.y = float(pos.y)
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.size = 24
-        self.vel = self._random_velocity(speed_range)
+        self.vx, self.vy = self._random_velocity(speed_range)
 
-    def _random_velocity(self, speed_range: Tuple[int, int]) -> pygame.Vector2:
+    def _random_velocity(self, speed_range: Tuple[int, int]) -> Tuple[float, float]:
         while True:
-            vel = pygame.Vector2(random.uniform(-1, 1), random.uniform(-1, 1))
-            if vel.length_squared() > 0.1:
-                vel = vel.normalize() * random.uniform(speed_range[0], speed_range[1])
-                return vel
-
-    def update(self, dt: float):
-        self.pos += self.vel * dt
-        bounced = False
-        if self.pos.x < self.size or self.pos.x > WIDTH - self.size:
-            self.vel.x *= -1
-            bounced = True
-        if self.pos.y < self.size + 40 or self.pos.y > HEIGHT - self.size:
-            self.vel.y *= -1
-            bounced = True
-        if bounced:
-            self.pos.x = max(self.size, min(WIDTH - self.size, self.pos.x))
-            self.pos.y = max(self.size + 40, min(HEIGHT - self.size, self.pos.y))
-
-    def nudge_away_from(self, point: pygame.Vector2):
-        direction = self.pos - point
-        if direction.length_squared() == 0:
-            direction = pygame.Vector2(random.uniform(-1, 1), random.uniform(-1, 1))
-        self.pos += direction.normalize() * 18
-
-    def draw(self, surface, offset: pygame.Vector2):
+            vx = random.uniform(-1, 1)
+            vy = random.uniform(-1, 1)
+            length_sq = vx * vx + vy * vy
+            if length_sq > 0.1:
+                speed = random.uniform(speed_range[0], speed_range[1]) / math.sqrt(length_sq)
+                return vx * speed, vy * speed
+
+    def nudge_away_from(self, px: float, py: float):
+        dx = self.x - px
+        dy = self.y - py
+        length = math.hypot(dx, dy)
+        if length == 0:
+            dx, dy = random.uniform(-1, 1), random.uniform(-1, 1)
+            length = math.hypot(dx, dy)
+        self.x += dx / length * 18
+        self.y += dy / length * 18
+
+    def draw(self, surface, offset: Tuple[float, float], alpha: float = 1.0):
+        rx = self.prev_x + (self.x - self.prev_x) * alpha
+        ry = self.prev_y + (self.y - self.prev_y) * alpha
         rect = pygame.Rect(0, 0, self.size, self.size)
-        rect.center = (int(self.pos.x + offset.x), int(self.pos.y + offset.y))
+        rect.center = (int(rx + offset[0]), int(ry + offset[1]))
         pygame.draw.rect(surface, COLORS["shadow"], rect.move(3, 4))
         pygame.draw.rect(surface, COLORS["hazard"], rect, border_radius=6)
         # Face
@@ -347,50 +490,54 @@ class Hazard:
         stripe_color = (255, 170, 120)
         pygame.draw.line(surface, stripe_color, (rect.left + 4, rect.top + 6), (rect.left + 10, rect.top + 16), 3)
         pygame.draw.line(surface, stripe_color, (rect.right - 4, rect.top + 6), (rect.right - 10, rect.top + 16), 3)
+        return rect.union(rect.move(3, 4))
 
 
 class Particle:
-    def __init__(self, pos: pygame.Vector2, vel: pygame.Vector2, lifetime: float, color: Tuple[int, int, int], size: int):
-        self.pos = pygame.Vector2(pos)
-        self.vel = pygame.Vector2(vel)
+    __slots__ = ("x", "y", "vx", "vy", "life", "total", "color", "size")
+
+    def __init__(self, pos, vel, lifetime: float, color: Tuple[int, int, int], size: int):
+        # Plain scalar state; Vector2 would cost two allocations per particle
+        # at spawn and more in the integrate loop. pos/vel just need indexing.
+        self.x = pos[0]
+        self.y = pos[1]
+        self.vx = vel[0]
+        self.vy = vel[1]
         self.life = lifetime
         self.total = lifetime
         self.color = color
         self.size = size
 
-    def update(self, dt: float):
-        self.pos += self.vel * dt
-        self.life -= dt
-
-    def draw(self, surface, offset: pygame.Vector2):
-        if self.life <= 0:
-            return
-        alpha = max(0, min(255, int((self.life / self.total) * 255)))
-        surf = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(surf, (*self.color, alpha), (self.size, self.size), self.size)
-        rect = surf.get_rect(center=(int(self.pos.x + offset.x), int(self.pos.y + offset.y)))
-        surface.blit(surf, rect)
+    # Integration is inlined in Game.update_effects; drawing lives in
+    # Game.draw_particles, which blits shared pre-rendered disc surfaces
+    # instead of rasterizing a circle per particle per frame.
 
 
 class FloatingText:
-    def __init__(self, pos: pygame.Vector2, text: str, color: Tuple[int, int, int]):
-        self.pos = pygame.Vector2(pos)
+    __slots__ = ("x", "y", "text", "color", "surf", "life")
+
+    def __init__(self, pos, text: str, color: Tuple[int, int, int], surf: pygame.Surface):
+        self.x = pos[0]
+        self.y = pos[1]
         self.text = text
         self.color = color
+        self.surf = surf  # rendered once, shared via Game's floater cache
         self.life = 1.0
 
-    def update(self, dt: float):
-        self.life -= dt
-        self.pos.y -= 30 * dt
-
-    def draw(self, surface, font, offset: pygame.Vector2):
+    def draw(self, surface, offset: Tuple[float, float]):
         if self.life <= 0:
-            return
-        alpha = max(0, min(255, int(self.life * 255)))
-        txt_surf = font.render(self.text, True, self.color)
-        txt_surf.set_alpha(alpha)
-        rect = txt_surf.get_rect(center=(int(self.pos.x + offset.x), int(self.pos.y + offset.y)))
-        surface.blit(txt_surf, rect)
+            return None
+        cx = int(self.x + offset[0])
+        cy = int(self.y + offset[1])
+        half_w = self.surf.get_width() // 2
+        half_h = self.surf.get_height() // 2
+        # Skip text that drifted fully offscreen.
+        if cx < -half_w or cx > WIDTH + half_w or cy < -half_h or cy > HEIGHT + half_h:
+            return None
+        self.surf.set_alpha(max(0, min(255, int(self.life * 255))))
+        rect = self.surf.get_rect(center=(cx, cy))
+        surface.blit(self.surf, rect)
+        return rect
 
 
 class Game:
@@ -407,12 +554,49 @@ class Game:
         self.assets = Assets(self.base_dir)
         self.high_score = self._load_high_score()
         self.new_high_score = False
-        self.state = "menu"
+        self.state = State.MENU
         self.difficulty_index = 0
         self.particles: List[Particle] = []
+        # Free-list of dead particles; spawning refills these in place
+        # instead of allocating (and later garbage-collecting) new objects.
+        self._particle_free: List[Particle] = []
         self.floaters: List[FloatingText] = []
+        # Shared flyweight surfaces for particle discs, keyed (color, size).
+        self._particle_sprites: dict = {}
+        # Rendered text surfaces keyed by slot; re-rendered only on change.
+        self._text_cache: dict = {}
+        # Floating score text keyed by (text, color); "+10" etc. recur often.
+        self._floater_cache: dict = {}
+        # (key, blit list) caches for the static menu / game-over screens.
+        self._menu_cache: Optional[tuple] = None
+        self._game_over_cache: Optional[tuple] = None
+        # Life icon rendered once; draw_lives_icons just blits copies.
+        self._heart_icon = pygame.Surface((20, 20), pygame.SRCALPHA)
+        pygame.draw.circle(self._heart_icon, COLORS["heart"], (10, 10), 10)
+        pygame.draw.circle(self._heart_icon, (255, 255, 255), (10, 8), 4)
+        self._heart_icon = self._heart_icon.convert_alpha()
+        # Full-screen overlays allocated once instead of per frame.
+        self._white_flash = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        self._white_flash.fill((255, 255, 255, 35))
+        self._dark_overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        self._dark_overlay.fill((0, 0, 0, 140))
         self.shake_timer = 0.0
         self.shake_strength = 10
+        # Damage-region tracking: rects drawn last frame, and the update list
+        # for the current frame (None means "flip the whole screen").
+        self._prev_rects: List[pygame.Rect] = []
+        self._dirty_rects: Optional[List[pygame.Rect]] = None
+        self._full_redraw = True
+        self._render_alpha = 1.0
+        # Camera offset sampled once per rendered frame in run(); calling
+        # camera_offset per draw would re-roll the shake jitter mid-frame.
+        self._frame_offset: Tuple[float, float] = _ZERO_OFFSET
+        self._draw_dispatch = {
+            State.MENU: self.draw_menu,
+            State.PLAYING: self.draw_game,
+            State.PAUSED: self.draw_pause,
+            State.GAME_OVER: self.draw_game_over,
+        }
         self.reset_run()
 
     def _load_high_score(self) -> int:
@@ -431,7 +615,7 @@ class Game:
             pass
 
     def _enter_game_over(self):
-        self.state = "game_over"
+        self.state = State.GAME_OVER
         if self.score > self.high_score:
             self.high_score = self.score
             self.new_high_score = True
@@ -452,55 +636,89 @@ class Game:
         self.time_accum = 0.0
         self.combo = 0
         self.combo_timer = 0.0
+        self._particle_free.extend(self.particles)
         self.particles.clear()
         self.floaters.clear()
         self.shake_timer = 0.0
         self.new_high_score = False
         self.spawn_hazards(diff["hazards"], diff["hazard_speed"])
         self.spawn_items(diff["items"])
-        self.state = "menu"  # show menu before first start
+        self.state = State.MENU  # show menu before first start
+
+    @staticmethod
+    def _grid_add(grid: dict, x: float, y: float, clearance: float):
+        grid.setdefault((int(x) // SPAWN_CELL, int(y) // SPAWN_CELL), []).append((x, y, clearance))
+
+    @staticmethod
+    def _grid_too_close(grid: dict, x: float, y: float, margin: float) -> bool:
+        # Only occupants of the candidate's 3x3 cell neighborhood can be in
+        # range, so rejection sampling stops scaling with total entity count.
+        cx = int(x) // SPAWN_CELL
+        cy = int(y) // SPAWN_CELL
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                for ox, oy, clearance in grid.get((gx, gy), ()):
+                    reach = clearance + margin
+                    if (ox - x) ** 2 + (oy - y) ** 2 < reach * reach:
+                        return True
+        return False
 
     def spawn_items(self, count: int):
         attempts = 0
         new_item_radius = (self.assets.cheese.get_width() // 2) if self.assets.cheese else 10
+        grid: dict = {}
+        for item in self.items:
+            self._grid_add(grid, item.pos.x, item.pos.y, item.radius + 8)
+        for h in self.hazards:
+            self._grid_add(grid, h.x, h.y, h.size + 12)
         while len(self.items) < count and attempts < count * 20:
             attempts += 1
             pos = pygame.Vector2(
                 random.randint(40, WIDTH - 40),
                 random.randint(80, HEIGHT - 40),
             )
-            too_close_player = pos.distance_to(self.player.pos) < 80
-            too_close_other = any(pos.distance_to(item.pos) < (item.radius + new_item_radius + 8) for item in self.items)
-            too_close_hazard = any(pos.distance_to(h.pos) < (h.size + new_item_radius + 12) for h in self.hazards)
-            if not too_close_player and not too_close_other and not too_close_hazard:
-                self.items.append(Item(pos, self.assets.cheese, self.assets.cheese_shadow))
+            if math.hypot(pos.x - self.player.px, pos.y - self.player.py) < 80:
+                continue
+            if self._grid_too_close(grid, pos.x, pos.y, new_item_radius):
+                continue
+            self.items.append(
+                Item(pos, self.assets.cheese_rots, self.assets.cheese_shadow_rots, new_item_radius)
+            )
+            self._grid_add(grid, pos.x, pos.y, new_item_radius + 8)
 
     def spawn_hazards(self, count: int, speed_range: Tuple[int, int]):
         attempts = 0
+        grid: dict = {}
+        for h in self.hazards:
+            self._grid_add(grid, h.x, h.y, 60)
         while len(self.hazards) < count and attempts < count * 25:
             attempts += 1
             pos = pygame.Vector2(
                 random.randint(60, WIDTH - 60),
                 random.randint(100, HEIGHT - 60),
             )
-            if pos.distance_to(self.player.pos) < 120:
+            if math.hypot(pos.x - self.player.px, pos.y - self.player.py) < 120:
                 continue
-            if any(pos.distance_to(h.pos) < 60 for h in self.hazards):
+            if self._grid_too_close(grid, pos.x, pos.y, 0):
                 continue
             self.hazards.append(Hazard(pos, speed_range))
+            self._grid_add(grid, pos.x, pos.y, 60)
 
     def start_game(self):
-        self.state = "playing"
+        self.state = State.PLAYING
+        self._full_redraw = True
         self.time_left = float(DIFFICULTIES[self.difficulty_index]["time"])
         self.score = 0
         self.lives = DIFFICULTIES[self.difficulty_index]["lives"]
         self.new_high_score = False
         self.combo = 0
         self.combo_timer = 0.0
-        self.player.pos = pygame.Vector2(WIDTH // 2, HEIGHT // 2)
+        self.player.px = self.player.prev_px = float(WIDTH // 2)
+        self.player.py = self.player.prev_py = float(HEIGHT // 2)
         self.player.hit_cooldown = 0.0
         self.items.clear()
         self.hazards.clear()
+        self._particle_free.extend(self.particles)
         self.particles.clear()
         self.floaters.clear()
         self.shake_timer = 0.0
@@ -520,22 +738,23 @@ class Game:
                 pygame.quit()
                 sys.exit()
 
-            if self.state in ("playing", "paused") and event.key in (pygame.K_p, pygame.K_ESCAPE):
-                self.state = "paused" if self.state == "playing" else "playing"
+            if self.state in (State.PLAYING, State.PAUSED) and event.key in (pygame.K_p, pygame.K_ESCAPE):
+                self.state = State.PAUSED if self.state == State.PLAYING else State.PLAYING
+                self._full_redraw = True
                 continue
 
-            if self.state == "playing" and event.key == pygame.K_r:
+            if self.state == State.PLAYING and event.key == pygame.K_r:
                 self.start_game()
                 continue
 
-            if self.state == "paused":
+            if self.state == State.PAUSED:
                 if event.key == pygame.K_r:
                     self.start_game()
                 elif event.key == pygame.K_m:
-                    self.state = "menu"
+                    self.state = State.MENU
                 continue
 
-            if self.state == "menu":
+            if self.state == State.MENU:
                 if event.key in (pygame.K_1, pygame.K_2, pygame.K_3):
                     self.difficulty_index = int(event.unicode) - 1
                     self.start_game()
@@ -549,18 +768,18 @@ class Game:
                     pygame.quit()
                     sys.exit()
 
-            if self.state == "game_over":
+            if self.state == State.GAME_OVER:
                 if event.key in (pygame.K_RETURN, pygame.K_SPACE):
                     self.start_game()
                 elif event.key in (pygame.K_r, pygame.K_m):
-                    self.state = "menu"
+                    self.state = State.MENU
 
     def update(self, dt: float):
         self.time_accum += dt
         if self.shake_timer > 0:
             self.shake_timer = max(0.0, self.shake_timer - dt)
         self.update_effects(dt)
-        if self.state != "playing":
+        if self.state != State.PLAYING:
             return
         if self.combo_timer > 0:
             self.combo_timer = max(0.0, self.combo_timer - dt)
@@ -568,19 +787,48 @@ class Game:
                 self.combo = 0
         keys = pygame.key.get_pressed()
         self.player.update(keys, dt)
-        for hazard in self.hazards:
-            hazard.update(dt)
+        self.update_hazards(dt)
         self.handle_collisions()
         self.time_left = max(0.0, self.time_left - dt)
         if self.time_left <= 0 or self.lives <= 0:
             self._enter_game_over()
 
+    def update_hazards(self, dt: float):
+        # One fused integrate-and-bounce pass over every hazard, with the
+        # module globals resolved once outside the loop.
+        width = WIDTH
+        height = HEIGHT
+        for hazard in self.hazards:
+            size = hazard.size
+            lo_x, hi_x = size, width - size
+            lo_y, hi_y = size + 40, height - size
+            hazard.prev_x = hazard.x
+            hazard.prev_y = hazard.y
+            x = hazard.x + hazard.vx * dt
+            y = hazard.y + hazard.vy * dt
+            if x < lo_x or x > hi_x:
+                hazard.vx = -hazard.vx
+                x = lo_x if x < lo_x else hi_x
+            if y < lo_y or y > hi_y:
+                hazard.vy = -hazard.vy
+                y = lo_y if y < lo_y else hi_y
+            hazard.x = x
+            hazard.y = y
+
     def handle_collisions(self):
-        # Player vs items
-        collected = []
+        # Hoist player state once; squared-distance compares avoid a Python-level
+        # sqrt (Vector2.distance_to) per item/hazard pair.
+        px = self.player.px
+        py = self.player.py
+        pr = self.player.radius
+        # Player vs items: one pass that scores hits and keeps survivors,
+        # instead of a second O(N) list.remove scan per collected item.
+        survivors = []
         for item in self.items:
-            if self.player.pos.distance_to(item.pos) <= self.player.radius + item.radius:
-                collected.append(item)
+            dx = item.pos.x - px
+            dy = item.pos.y - py
+            reach = pr + item.radius
+            if dx * dx + dy * dy <= reach * reach:
                 if self.combo_timer > 0:
                     self.combo += 1
                 else:
@@ -590,8 +838,9 @@ class Game:
                 points = 10 + bonus
                 self.score += points
                 self.spawn_collect_effect(item.pos, points, self.combo)
-        for item in collected:
-            self.items.remove(item)
+            else:
+                survivors.append(item)
+        self.items = survivors
         if not self.items:
             diff = DIFFICULTIES[self.difficulty_index]
             self.spawn_items(diff["items"])
@@ -599,21 +848,29 @@ class Game:
         if not self.player.can_take_hit():
             return
         for hazard in self.hazards:
-            if self.player.pos.distance_to(hazard.pos) <= self.player.radius + hazard.size * 0.5:
+            dx = hazard.x - px
+            dy = hazard.y - py
+            reach = pr + hazard.size * 0.5
+            if dx * dx + dy * dy <= reach * reach:
                 self.lives -= 1
                 self.player.mark_hit()
-                hazard.nudge_away_from(self.player.pos)
-                self.spawn_hit_effect(self.player.pos)
+                hazard.nudge_away_from(px, py)
+                self.spawn_hit_effect((px, py))
                 break
 
     def build_background(self) -> pygame.Surface:
-        top = pygame.Surface((WIDTH, HEIGHT))
+        # Paint the vertical gradient into a 1px-wide strip and let
+        # pygame.transform.scale fan it out, instead of 600 draw.line calls.
+        strip = pygame.Surface((1, HEIGHT))
+        top_col = COLORS["bg_top"]
+        bot_col = COLORS["bg_bottom"]
         for y in range(HEIGHT):
             blend = y / HEIGHT
-            r = int(COLORS["bg_top"][0] * (1 - blend) + COLORS["bg_bottom"][0] * blend)
-            g = int(COLORS["bg_top"][1] * (1 - blend) + COLORS["bg_bottom"][1] * blend)
-            b = int(COLORS["bg_top"][2] * (1 - blend) + COLORS["bg_bottom"][2] * blend)
-            pygame.draw.line(top, (r, g, b), (0, y), (WIDTH, y))
+            r = int(top_col[0] * (1 - blend) + bot_col[0] * blend)
+            g = int(top_col[1] * (1 - blend) + bot_col[1] * blend)
+            b = int(top_col[2] * (1 - blend) + bot_col[2] * blend)
+            strip.set_at((0, y), (r, g, b))
+        top = pygame.transform.scale(strip, (WIDTH, HEIGHT))
         # Add subtle floor pattern
         tile = 60
         shade = pygame.Surface((tile, tile), pygame.SRCALPHA)
@@ -622,40 +879,58 @@ class Game:
             for y in range(40, HEIGHT, tile):
                 if (x // tile + y // tile) % 2 == 0:
                     top.blit(shade, (x, y))
-        return top
+        return top.convert()
 
     def draw_background(self):
         self.screen.blit(self.background, (0, 0))
 
+    def _cached_text(self, key: str, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        # font.render rasterizes through the TTF engine; only pay for it when
+        # the string for this HUD slot actually changes.
+        entry = self._text_cache.get(key)
+        if entry is None or entry[0] != text:
+            surf = self.font.render(text, True, color)
+            self._text_cache[key] = (text, surf)
+            return surf
+        return entry[1]
+
     def draw_hud(self):
         diff = DIFFICULTIES[self.difficulty_index]
-        score_text = self.font.render(f"Score: {self.score}", True, COLORS["hud"])
-        timer_text = self.font.render(f"Time: {int(self.time_left)}s", True, COLORS["hud"])
-        lives_text = self.font.render(f"Lives: {self.lives}", True, COLORS["hud"])
-        diff_text = self.font.render(f"Difficulty: {diff['name']}", True, COLORS["hud"])
-        high_text = self.font.render(f"High: {self.high_score}", True, COLORS["hud"])
+        hud_color = COLORS["hud"]
+        score_text = self._cached_text("score", f"Score: {self.score}", hud_color)
+        timer_text = self._cached_text("timer", f"Time: {int(self.time_left)}s", hud_color)
+        lives_text = self._cached_text("lives", f"Lives: {self.lives}", hud_color)
+        diff_text = self._cached_text("diff", f"Difficulty: {diff['name']}", hud_color)
+        high_text = self._cached_text("high", f"High: {self.high_score}", hud_color)
         self.screen.blit(score_text, (14, 10))
         self.screen.blit(timer_text, (14, 34))
         self.screen.blit(diff_text, (WIDTH - 200, 34))
         self.screen.blit(high_text, (WIDTH - 200, 58))
-        if self.combo > 1 and self.state == "playing":
-            combo_text = self.font.render(f"Combo x{self.combo}", True, COLORS["item"])
+        if self.combo > 1 and self.state == State.PLAYING:
+            combo_text = self._cached_text("combo", f"Combo x{self.combo}", COLORS["item"])
             self.screen.blit(combo_text, (WIDTH - 200, 82))
         self.screen.blit(lives_text, (WIDTH - 120, 10))
         self.draw_lives_icons()
-        if self.player.hit_cooldown > 0 and self.state == "playing":
-            flash = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            flash.fill((255, 255, 255, 35))
-            self.screen.blit(flash, (0, 0))
-
-    def draw_menu(self):
-        self.draw_background()
+        if self.player.hit_cooldown > 0 and self.state == State.PLAYING:
+            self.screen.blit(self._white_flash, (0, 0))
+            # The tint touched every pixel, so the first frame after it
+            # fades must redraw fully or the wash stays baked in outside
+            # the dirty rects.
+            self._full_redraw = True
+
+    def _menu_blits(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        # The menu is static between selection/high-score changes; rasterize
+        # its text once per (difficulty, high score) combination.
+        key = (self.difficulty_index, self.high_score)
+        if self._menu_cache is not None and self._menu_cache[0] == key:
+            return self._menu_cache[1]
+        blits = []
         title = self.huge_font.render("Mouse Dash!", True, COLORS["hud"])
-        self.screen.blit(title, (WIDTH // 2 - title.get_width() // 2, 110))
+        blits.append((title, (WIDTH // 2 - title.get_width() // 2, 110)))
         subtitle = self.font.render("Collect cheese, dodge cats, beat the clock.", True, COLORS["hud"])
-        self.screen.blit(subtitle, (WIDTH // 2 - subtitle.get_width() // 2, 170))
+        blits.append((subtitle, (WIDTH // 2 - subtitle.get_width() // 2, 170)))
         best = self.font.render(f"High Score: {self.high_score}", True, COLORS["hud"])
-        self.screen.blit(best, (WIDTH // 2 - best.get_width() // 2, 195))
+        blits.append((best, (WIDTH // 2 - best.get_width() // 2, 195)))
         for idx, diff in enumerate(DIFFICULTIES):
             color = COLORS["hud"] if idx != self.difficulty_index else COLORS["item"]
             line = self.big_font.render(
@@ -663,44 +938,89 @@ class Game:
                 True,
                 color,
             )
-            self.screen.blit(line, (WIDTH // 2 - line.get_width() // 2, 230 + idx * 50))
+            blits.append((line, (WIDTH // 2 - line.get_width() // 2, 230 + idx * 50)))
         hint = self.font.render("1/2/3: level  Enter/Space: start  Arrows/WASD: move  Q: quit", True, COLORS["hud"])
-        self.screen.blit(hint, (WIDTH // 2 - hint.get_width() // 2, HEIGHT - 80))
+        blits.append((hint, (WIDTH // 2 - hint.get_width() // 2, HEIGHT - 80)))
+        self._menu_cache = (key, blits)
+        return blits
 
-    def draw_game(self):
+    def draw_menu(self):
         self.draw_background()
-        offset = self.camera_offset()
+        for surf, pos in self._menu_blits():
+            self.screen.blit(surf, pos)
+
+    def draw_game(self):
+        offset = self._frame_offset
+        # Partial updates only make sense while playing with a steady camera;
+        # shake moves everything and the hit flash covers the whole screen.
+        full = (
+            self._full_redraw
+            or self.state != State.PLAYING
+            or offset[0] != 0
+            or offset[1] != 0
+            or self.player.hit_cooldown > 0
+        )
+        screen_rect = self.screen.get_rect()
+        if full:
+            self.draw_background()
+            self._full_redraw = False
+            self._dirty_rects = None
+        else:
+            # Restore the background under everything drawn last frame.
+            for rect in self._prev_rects:
+                clipped = rect.clip(screen_rect)
+                if clipped.width and clipped.height:
+                    self.screen.blit(self.background, clipped, clipped)
+            self.screen.blit(self.background, HUD_RECT, HUD_RECT)
+        new_rects: List[pygame.Rect] = []
+        # One sin/cos pair per frame; each item folds in its wobble phase.
+        sin_t = math.sin(self.time_accum * 4)
+        cos_t = math.cos(self.time_accum * 4)
         for item in self.items:
-            item.draw(self.screen, self.time_accum, offset)
+            new_rects.append(item.draw(self.screen, sin_t, cos_t, offset))
         for hazard in self.hazards:
-            hazard.draw(self.screen, offset)
-        self.player.draw(self.screen, offset)
-        self.draw_particles(offset)
-        self.draw_floaters(offset)
+            new_rects.append(hazard.draw(self.screen, offset, self._render_alpha))
+        new_rects.append(self.player.draw(self.screen, offset, self._render_alpha))
+        new_rects.extend(self.draw_particles(offset))
+        new_rects.extend(self.draw_floaters(offset))
         self.draw_hud()
-
-    def draw_game_over(self):
-        self.draw_game()
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 140))
-        self.screen.blit(overlay, (0, 0))
+        if not full:
+            dirty = [HUD_RECT]
+            for rect in self._prev_rects + new_rects:
+                clipped = rect.clip(screen_rect)
+                if clipped.width and clipped.height:
+                    dirty.append(clipped)
+            self._dirty_rects = dirty
+        self._prev_rects = new_rects
+
+    def _game_over_blits(self) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        key = (self.score, self.high_score, self.new_high_score)
+        if self._game_over_cache is not None and self._game_over_cache[0] == key:
+            return self._game_over_cache[1]
+        blits = []
         txt = self.huge_font.render("Game Over", True, COLORS["hud"])
-        self.screen.blit(txt, (WIDTH // 2 - txt.get_width() // 2, HEIGHT // 2 - 90))
+        blits.append((txt, (WIDTH // 2 - txt.get_width() // 2, HEIGHT // 2 - 90)))
         summary = self.big_font.render(f"Score: {self.score}", True, COLORS["hud"])
-        self.screen.blit(summary, (WIDTH // 2 - summary.get_width() // 2, HEIGHT // 2 - 30))
+        blits.append((summary, (WIDTH // 2 - summary.get_width() // 2, HEIGHT // 2 - 30)))
         best = self.font.render(f"High Score: {self.high_score}", True, COLORS["hud"])
-        self.screen.blit(best, (WIDTH // 2 - best.get_width() // 2, HEIGHT // 2 + 5))
+        blits.append((best, (WIDTH // 2 - best.get_width() // 2, HEIGHT // 2 + 5)))
         if self.new_high_score:
             new_best = self.font.render("New High Score!", True, COLORS["item"])
-            self.screen.blit(new_best, (WIDTH // 2 - new_best.get_width() // 2, HEIGHT // 2 - 5))
+            blits.append((new_best, (WIDTH // 2 - new_best.get_width() // 2, HEIGHT // 2 - 5)))
         hint = self.font.render("Enter/Space: restart   R/M: menu   Q: quit", True, COLORS["hud"])
-        self.screen.blit(hint, (WIDTH // 2 - hint.get_width() // 2, HEIGHT // 2 + 30))
+        blits.append((hint, (WIDTH // 2 - hint.get_width() // 2, HEIGHT // 2 + 30)))
+        self._game_over_cache = (key, blits)
+        return blits
+
+    def draw_game_over(self):
+        self.draw_game()
+        self.screen.blit(self._dark_overlay, (0, 0))
+        for surf, pos in self._game_over_blits():
+            self.screen.blit(surf, pos)
 
     def draw_pause(self):
         self.draw_game()
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 140))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dark_overlay, (0, 0))
         txt = self.huge_font.render("Paused", True, COLORS["hud"])
         self.screen.blit(txt, (WIDTH // 2 - txt.get_width() // 2, HEIGHT // 2 - 70))
         hint = self.font.render("P/Esc: resume   R: restart   M: menu   Q: quit", True, COLORS["hud"])
@@ -708,70 +1028,191 @@ class Game:
 
     def draw_lives_icons(self):
         for i in range(self.lives):
-            x = 14 + i * 26
-            y = 60
-            pygame.draw.circle(self.screen, COLORS["heart"], (x + 10, y + 10), 10)
-            pygame.draw.circle(self.screen, (255, 255, 255), (x + 10, y + 8), 4)
+            self.screen.blit(self._heart_icon, (14 + i * 26, 60))
+
+    def _spawn_burst(
+        self,
+        pos,
+        count: int,
+        speed_lo: float,
+        speed_hi: float,
+        lifetime: float,
+        color: Tuple[int, int, int],
+        size: int,
+    ):
+        # Hot burst loop: globals/methods bound once, velocities built as
+        # plain scalars so no intermediate Vector2 is allocated per particle.
+        # Dead particles are recycled from the free-list rather than
+        # re-allocated; past the pool cap the extra burst fill is dropped.
+        budget = MAX_PARTICLES - len(self.particles)
+        if count > budget:
+            count = budget
+        uniform = random.uniform
+        cos = math.cos
+        sin = math.sin
+        two_pi = math.pi * 2
+        append = self.particles.append
+        free = self._particle_free
+        px = pos[0]
+        py = pos[1]
+        for _ in range(count):
+            angle = uniform(0.0, two_pi)
+            speed = uniform(speed_lo, speed_hi)
+            if free:
+                p = free.pop()
+                p.x = px
+                p.y = py
+                p.vx = cos(angle) * speed
+                p.vy = sin(angle) * speed
+                p.life = p.total = lifetime
+                p.color = color
+                p.size = size
+                append(p)
+            else:
+                append(Particle(pos, (cos(angle) * speed, sin(angle) * speed), lifetime, color, size))
+
+    def _floater_surface(self, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        key = (text, color)
+        surf = self._floater_cache.get(key)
+        if surf is None:
+            surf = self.font.render(text, True, color)
+            self._floater_cache[key] = surf
+        return surf
 
     def spawn_collect_effect(self, pos: pygame.Vector2, points: int, combo: int):
-        for _ in range(12):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(80, 160)
-            vel = pygame.Vector2(math.cos(angle), math.sin(angle)) * speed
-            self.particles.append(Particle(pos, vel, 0.4, COLORS["gold"], 3))
-        self.floaters.append(FloatingText(pos, f"+{points}", COLORS["gold"]))
+        self._spawn_burst(pos, 12, 80, 160, 0.4, _COLOR_GOLD, 3)
+        text = f"+{points}"
+        self.floaters.append(FloatingText(pos, text, _COLOR_GOLD, self._floater_surface(text, _COLOR_GOLD)))
         if combo >= 2:
-            self.floaters.append(FloatingText(pos + pygame.Vector2(0, -18), f"Combo x{combo}", COLORS["item"]))
-
-    def spawn_hit_effect(self, pos: pygame.Vector2):
-        for _ in range(18):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(120, 220)
-            vel = pygame.Vector2(math.cos(angle), math.sin(angle)) * speed
-            self.particles.append(Particle(pos, vel, 0.5, COLORS["hazard"], 4))
+            combo_text = f"Combo x{combo}"
+            self.floaters.append(
+                FloatingText(
+                    (pos[0], pos[1] - 18),
+                    combo_text,
+                    _COLOR_ITEM,
+                    self._floater_surface(combo_text, _COLOR_ITEM),
+                )
+            )
+
+    def spawn_hit_effect(self, pos: Tuple[float, float]):
+        self._spawn_burst(pos, 18, 120, 220, 0.5, _COLOR_HAZARD, 4)
         self.shake_timer = 0.25
 
     def update_effects(self, dt: float):
-        for p in list(self.particles):
-            p.update(dt)
-            if p.life <= 0:
-                self.particles.remove(p)
-        for ft in list(self.floaters):
-            ft.update(dt)
-            if ft.life <= 0:
-                self.floaters.remove(ft)
-
-    def draw_particles(self, offset: pygame.Vector2):
+        # Quiet frames (no live effects) skip the whole pass.
+        if not self.particles and not self.floaters:
+            return
+        # Fused update-and-reap: a dead entry is swapped with the tail and
+        # popped, so one linear pass does both jobs with no rebuild copy.
+        # Draw order between particles doesn't matter, so the swap is safe.
+        # The integration is inlined (no per-object update() dispatch, no
+        # temporary Vector2 from vel * dt) so the pass is a single tight loop.
+        particles = self.particles
+        recycle = self._particle_free.append
+        i = 0
+        n = len(particles)
+        while i < n:
+            p = particles[i]
+            life = p.life - dt
+            if life <= 0:
+                recycle(p)
+                n -= 1
+                particles[i] = particles[n]
+                particles.pop()
+            else:
+                p.life = life
+                p.x += p.vx * dt
+                p.y += p.vy * dt
+                i += 1
+        floaters = self.floaters
+        i = 0
+        n = len(floaters)
+        while i < n:
+            ft = floaters[i]
+            life = ft.life - dt
+            if life <= 0:
+                ft.life = life
+                n -= 1
+                floaters[i] = floaters[n]
+                floaters.pop()
+            else:
+                ft.life = life
+                ft.y -= 30 * dt
+                i += 1
+
+    def _particle_sprites_for(self, color: Tuple[int, int, int], size: int) -> List[pygame.Surface]:
+        key = (color, size)
+        variants = self._particle_sprites.get(key)
+        if variants is None:
+            variants = []
+            for i in range(PARTICLE_ALPHA_STEPS):
+                alpha = int(255 * (i + 1) / PARTICLE_ALPHA_STEPS)
+                surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                pygame.draw.circle(surf, (color[0], color[1], color[2], alpha), (size, size), size)
+                variants.append(surf.convert_alpha())
+            self._particle_sprites[key] = variants
+        return variants
+
+    def draw_particles(self, offset: Tuple[float, float]) -> List[pygame.Rect]:
+        if not self.particles:
+            return []
+        ox, oy = offset
+        max_step = PARTICLE_ALPHA_STEPS - 1
+        sprites_for = self._particle_sprites_for
+        seq = []
+        append = seq.append
         for p in self.particles:
-            p.draw(self.screen, offset)
-
-    def draw_floaters(self, offset: pygame.Vector2):
+            if p.life <= 0:
+                continue
+            size = p.size
+            sx = int(p.x + ox) - size
+            sy = int(p.y + oy) - size
+            # Anything fully outside the screen never reaches the blitter.
+            if sx + size * 2 < 0 or sx > WIDTH or sy + size * 2 < 0 or sy > HEIGHT:
+                continue
+            step = int(p.life / p.total * PARTICLE_ALPHA_STEPS)
+            sprite = sprites_for(p.color, p.size)[step if step < max_step else max_step]
+            append((sprite, (sx, sy)))
+        # One C-level batch instead of a Python->C blit round trip each;
+        # the returned rects feed the damage-region update list.
+        return self.screen.blits(seq)
+
+    def draw_floaters(self, offset: Tuple[float, float]) -> List[pygame.Rect]:
+        rects = []
         for ft in self.floaters:
-            ft.draw(self.screen, self.font, offset)
+            rect = ft.draw(self.screen, offset)
+            if rect is not None:
+                rects.append(rect)
+        return rects
 
-    def camera_offset(self) -> pygame.Vector2:
+    def camera_offset(self) -> Tuple[float, float]:
         if self.shake_timer <= 0:
-            return pygame.Vector2(0, 0)
-        power = self.shake_timer / 0.25
-        return pygame.Vector2(
-            random.uniform(-1, 1) * self.shake_strength * power,
-            random.uniform(-1, 1) * self.shake_strength * power,
-        )
+            return _ZERO_OFFSET
+        rand = random.random
+        # shake_timer / 0.25 folded into a single multiplier.
+        power = self.shake_strength * self.shake_timer * 4.0
+        return ((rand() * 2.0 - 1.0) * power, (rand() * 2.0 - 1.0) * power)
 
     def run(self):
+        accumulator = 0.0
+        tick = self.clock.tick
+        draw_dispatch = self._draw_dispatch
         while True:
-            dt = self.clock.tick(FPS) / 1000.0
+            frame_time = tick(FPS) / 1000.0
             self.handle_events()
-            self.update(dt)
-            if self.state == "menu":
-                self.draw_menu()
-            elif self.state == "playing":
-                self.draw_game()
-            elif self.state == "paused":
-                self.draw_pause()
-            elif self.state == "game_over":
-                self.draw_game_over()
-            pygame.display.flip()
+            # Fixed-timestep simulation: render rate can vary, physics can't.
+            accumulator += min(frame_time, MAX_FRAME_TIME)
+            while accumulator >= FIXED_DT:
+                self.update(FIXED_DT)
+                accumulator -= FIXED_DT
+            self._render_alpha = accumulator / FIXED_DT
+            self._frame_offset = self.camera_offset()
+            draw_dispatch[self.state]()
+            if self.state == State.PLAYING and self._dirty_rects is not None:
+                pygame.display.update(self._dirty_rects)
+            else:
+                pygame.display.flip()
+            self._dirty_rects = None
 
 
 if __name__ == "__main__":